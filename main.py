@@ -1,8 +1,9 @@
 import sys
 import math
 import random
+import numpy as np
 import pygame
-from typing import List, Tuple, Set
+from typing import List, Optional, Tuple, Set
 
 # ------------------------------
 # Config & Constants
@@ -46,28 +47,26 @@ POWER_DURATION_MS = 6000
 PELLET_SCORE = 10
 POWER_PELLET_SCORE = 50
 GHOST_EAT_SCORE = 200
+# Pacman/ghost collision radius, squared so collisions compare squared
+# distances and skip the sqrt.
+COLLISION_DIST_SQ = (TILE_SIZE * 0.6) ** 2
 
 UI_HEIGHT = 64
 FONT_NAME = None  # default system font
 
-# Directions
-UP = (0, -1)
-DOWN = (0, 1)
-LEFT = (-1, 0)
-RIGHT = (1, 0)
-STOP = (0, 0)
+# Directions as int indices into DVEC. The ordering makes the opposite
+# direction a single XOR: opposite(d) == d ^ 2.
+UP, RIGHT, DOWN, LEFT = 0, 1, 2, 3
+STOP = 4
+DVEC = ((0, -1), (1, 0), (0, 1), (-1, 0), (0, 0))
 
 
 # ------------------------------
 # Helper Functions
 # ------------------------------
 
-def add_tuple(a: Tuple[int, int], b: Tuple[int, int]) -> Tuple[int, int]:
-    return (a[0] + b[0], a[1] + b[1])
-
-
-def opposite(dir_: Tuple[int, int]) -> Tuple[int, int]:
-    return (-dir_[0], -dir_[1])
+def opposite(dir_: int) -> int:
+    return dir_ ^ 2
 
 
 def grid_to_pixel(cell: Tuple[int, int]) -> Tuple[float, float]:
@@ -77,19 +76,51 @@ def grid_to_pixel(cell: Tuple[int, int]) -> Tuple[float, float]:
     return (x, y)
 
 
-def pixel_to_grid(pos: Tuple[float, float]) -> Tuple[int, int]:
-    x, y = pos
-    y -= UI_HEIGHT
+def pixel_to_grid(x: float, y: float) -> Tuple[int, int]:
     c = int(x // TILE_SIZE)
-    r = int(y // TILE_SIZE)
+    r = int((y - UI_HEIGHT) // TILE_SIZE)
     return (c, r)
 
 
-def is_centered(pos: Tuple[float, float]) -> bool:
-    x, y = pos
-    gx = (x - TILE_SIZE / 2) % TILE_SIZE
-    gy = (y - UI_HEIGHT - TILE_SIZE / 2) % TILE_SIZE
-    return abs(gx) < 0.5 and abs(gy) < 0.5
+# Tile-center offsets, hoisted out of is_centered.
+_CENTER_OFF_X = TILE_SIZE / 2
+_CENTER_OFF_Y = UI_HEIGHT + TILE_SIZE / 2
+
+
+def is_centered(x: float, y: float) -> bool:
+    # The modulo residue is always non-negative, so no abs() is needed.
+    return (x - _CENTER_OFF_X) % TILE_SIZE < 0.5 and (y - _CENTER_OFF_Y) % TILE_SIZE < 0.5
+
+
+# Optional JIT acceleration: the movement step is a free function over
+# scalars and the uint8 wall grid, so numba can compile it when installed.
+# Without numba the plain-Python version below runs unchanged.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _move_step(px: float, py: float, dx: int, dy: int, speed: float,
+               grid: np.ndarray) -> Tuple[float, float]:
+    cc = int(px // TILE_SIZE)
+    cr = int((py - UI_HEIGHT) // TILE_SIZE)
+    # One wall query per frame: a per-frame step (< half a tile) can only be
+    # stopped by the cell ahead, in which case movement clamps at the
+    # current cell's center.
+    if grid[cr + dy, cc + dx] != 1:
+        return px + dx * speed, py + dy * speed
+    if dx != 0:
+        tx = cc * TILE_SIZE + _CENTER_OFF_X
+        nx = px + dx * speed
+        return (min(nx, tx) if dx > 0 else max(nx, tx)), py
+    ty = cr * TILE_SIZE + _CENTER_OFF_Y
+    ny = py + dy * speed
+    return px, (min(ny, ty) if dy > 0 else max(ny, ty))
+
+
+if njit is not None:
+    _move_step = njit(cache=True)(_move_step)
 
 
 # ------------------------------
@@ -97,30 +128,91 @@ def is_centered(pos: Tuple[float, float]) -> bool:
 # ------------------------------
 class Maze:
     def __init__(self, layout: List[List[int]]):
-        self.layout = [row[:] for row in layout]
-        self.rows = len(self.layout)
-        self.cols = len(self.layout[0])
+        # Contiguous uint8 grid: single element access per wall query
+        # instead of list-of-lists double indexing.
+        self.grid = np.asarray(layout, dtype=np.uint8)
+        self.rows, self.cols = self.grid.shape
+        # is_wall skips bounds checks, so the layout must be enclosed by a
+        # wall border that actors can never cross.
+        if not (np.all(self.grid[0] == 1) and np.all(self.grid[-1] == 1)
+                and np.all(self.grid[:, 0] == 1) and np.all(self.grid[:, -1] == 1)):
+            raise ValueError("maze layout must be enclosed by a wall border")
+        # The maze is static: precompute wall booleans and each open cell's
+        # walkable directions once so per-frame queries are plain lookups.
+        self.walls: List[List[bool]] = (self.grid == 1).tolist()
+        self.open_dirs = {
+            (c, r): tuple(d for d in (UP, RIGHT, DOWN, LEFT)
+                          if not self.walls[r + DVEC[d][1]][c + DVEC[d][0]])
+            for r in range(self.rows) for c in range(self.cols)
+            if not self.walls[r][c]
+        }
+        # Ghost AI: for each (cell, incoming direction), the directions a
+        # ghost may take without reversing, falling back to reversing when
+        # cornered. Lets Ghost.update index a tuple instead of rebuilding
+        # and filtering an option list every decision.
+        self.open_dirs_norev = {}
+        for cell, opts in self.open_dirs.items():
+            for d in (UP, RIGHT, DOWN, LEFT):
+                opp = opposite(d)
+                norev = tuple(o for o in opts if o != opp) if len(opts) > 1 else opts
+                self.open_dirs_norev[(cell, d)] = norev or (opp,)
         self.pellets: Set[Tuple[int, int]] = set()
         self.power_pellets: Set[Tuple[int, int]] = set()
         self._scan_pellets()
+        self._pellet_r = max(4, TILE_SIZE // 12)
+        self._power_base_r = max(8, TILE_SIZE // 6)
+        # Every dot is the same sprite, so rasterize each circle once and
+        # blit it per instance; the power pellet gets one image per pulse
+        # radius (pulse is always in 0..4).
+        self._pellet_img = self._bake_dot(WHITE, self._pellet_r)
+        self._power_imgs = tuple(self._bake_dot(ORANGE, self._power_base_r + p)
+                                 for p in range(5))
+        self._bg = self._render_background()
+        self._pellets_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        self._pellets_dirty = True
+
+    def _render_background(self) -> pygame.Surface:
+        # Walls never change, so bake background + walls into one surface
+        # and blit it per frame instead of re-drawing every rect.
+        bg = pygame.Surface((WIDTH, HEIGHT))
+        bg.fill(BLACK)
+        pygame.draw.rect(bg, NAVY, (0, UI_HEIGHT, WIDTH, HEIGHT - UI_HEIGHT))
+        for r, c in np.argwhere(self.grid == 1).tolist():
+            x = c * TILE_SIZE
+            y = r * TILE_SIZE + UI_HEIGHT
+            pygame.draw.rect(bg, BLUE, (x, y, TILE_SIZE, TILE_SIZE))
+        return bg.convert()
+
+    @staticmethod
+    def _bake_dot(color: Tuple[int, int, int], radius: int) -> pygame.Surface:
+        img = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+        pygame.draw.circle(img, color, (radius, radius), radius)
+        return img.convert_alpha()
+
+    def _rebuild_pellets_surf(self):
+        self._pellets_surf.fill((0, 0, 0, 0))
+        pr = self._pellet_r
+        for (c, r) in self.pellets:
+            cx = c * TILE_SIZE + TILE_SIZE // 2
+            cy = r * TILE_SIZE + TILE_SIZE // 2 + UI_HEIGHT
+            self._pellets_surf.blit(self._pellet_img, (cx - pr, cy - pr))
+        self._pellets_dirty = False
 
     def _scan_pellets(self):
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.layout[r][c] == 2:
-                    self.pellets.add((c, r))
-                elif self.layout[r][c] == 3:
-                    self.power_pellets.add((c, r))
+        rs, cs = np.where(self.grid == 2)
+        self.pellets = set(zip(cs.tolist(), rs.tolist()))
+        rs, cs = np.where(self.grid == 3)
+        self.power_pellets = set(zip(cs.tolist(), rs.tolist()))
 
     def in_bounds(self, cell: Tuple[int, int]) -> bool:
         c, r = cell
         return 0 <= r < self.rows and 0 <= c < self.cols
 
     def is_wall(self, cell: Tuple[int, int]) -> bool:
-        if not self.in_bounds(cell):
-            return True
+        # No bounds check: the layout is wall-bordered (enforced in
+        # __init__), so any cell an actor can query is in bounds.
         c, r = cell
-        return self.layout[r][c] == 1
+        return self.walls[r][c]
 
     def eat_at(self, cell: Tuple[int, int]) -> int:
         """
@@ -128,11 +220,12 @@ class Maze:
         """
         if cell in self.pellets:
             self.pellets.remove(cell)
-            self.layout[cell[1]][cell[0]] = 0
+            self.grid[cell[1], cell[0]] = 0
+            self._pellets_dirty = True
             return PELLET_SCORE
         if cell in self.power_pellets:
             self.power_pellets.remove(cell)
-            self.layout[cell[1]][cell[0]] = 0
+            self.grid[cell[1], cell[0]] = 0
             return POWER_PELLET_SCORE
         return 0
 
@@ -141,34 +234,41 @@ class Maze:
 
     def neighbors_open(self, cell: Tuple[int, int]) -> List[Tuple[int, int]]:
         c, r = cell
-        candidates = [(c+1, r), (c-1, r), (c, r+1), (c, r-1)]
-        return [p for p in candidates if not self.is_wall(p)]
+        return [(c + DVEC[d][0], r + DVEC[d][1]) for d in self.open_dirs.get(cell, ())]
 
-    def draw(self, screen: pygame.Surface):
-        # Background playfield
-        screen.fill(BLACK)
-        pygame.draw.rect(screen, NAVY, (0, UI_HEIGHT, WIDTH, HEIGHT - UI_HEIGHT))
-
-        # Walls
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.layout[r][c] == 1:
-                    x = c * TILE_SIZE
-                    y = r * TILE_SIZE + UI_HEIGHT
-                    pygame.draw.rect(screen, BLUE, (x, y, TILE_SIZE, TILE_SIZE))
-
-        # Pellets
-        for (c, r) in self.pellets:
+    def animated_rects(self) -> List[pygame.Rect]:
+        # Bounding rects of the pulsing power pellets (sized for the widest
+        # pulse), used by the dirty-rect pass in Game.run.
+        rmax = self._power_base_r + 5
+        rects = []
+        for (c, r) in self.power_pellets:
             cx = c * TILE_SIZE + TILE_SIZE // 2
             cy = r * TILE_SIZE + TILE_SIZE // 2 + UI_HEIGHT
-            pygame.draw.circle(screen, WHITE, (cx, cy), max(4, TILE_SIZE // 12))
-
-        # Power pellets (pulse)
-        pulse = 2 + int(2 * math.sin(pygame.time.get_ticks() / 150.0))
+            rects.append(pygame.Rect(cx - rmax, cy - rmax, 2 * rmax, 2 * rmax))
+        return rects
+
+    def draw(self, screen: pygame.Surface, now: int, dirty: Optional[List[pygame.Rect]] = None):
+        if self._pellets_dirty:
+            self._rebuild_pellets_surf()
+
+        # Background + walls (pre-rendered) and cached pellets: restore the
+        # whole frame, or just the dirty regions when a rect list is given.
+        if dirty is None:
+            screen.blit(self._bg, (0, 0))
+            screen.blit(self._pellets_surf, (0, 0))
+        else:
+            for rect in dirty:
+                screen.blit(self._bg, rect, rect)
+                screen.blit(self._pellets_surf, rect, rect)
+
+        # Power pellets (pulse): pick the pre-baked image for this pulse radius
+        pulse = 2 + int(2 * math.sin(now / 150.0))
+        img = self._power_imgs[pulse]
+        rad = self._power_base_r + pulse
         for (c, r) in self.power_pellets:
             cx = c * TILE_SIZE + TILE_SIZE // 2
             cy = r * TILE_SIZE + TILE_SIZE // 2 + UI_HEIGHT
-            pygame.draw.circle(screen, ORANGE, (cx, cy), max(8, TILE_SIZE // 6) + pulse)
+            screen.blit(img, (cx - rad, cy - rad))
 
 
 # ------------------------------
@@ -177,49 +277,29 @@ class Maze:
 class Actor:
     def __init__(self, maze: Maze, cell: Tuple[int, int], color: Tuple[int, int, int], speed: float):
         self.maze = maze
-        self.pos = list(grid_to_pixel(cell))  # [x, y] in pixels
+        # Position in pixels, kept as two plain float slots (cheaper than
+        # indexing a list in the per-frame movement code).
+        self.px, self.py = grid_to_pixel(cell)
         self.color = color
-        self.dir = STOP
+        self.dir = STOP  # int index into DVEC
         self.speed = speed
         self.radius = TILE_SIZE * 0.35
 
     def current_cell(self) -> Tuple[int, int]:
-        return pixel_to_grid(tuple(self.pos))
+        return pixel_to_grid(self.px, self.py)
 
-    def set_dir(self, new_dir: Tuple[int, int]):
+    def set_dir(self, new_dir: int):
         self.dir = new_dir
 
-    def can_move_dir(self, dir_: Tuple[int, int]) -> bool:
-        # Check next tile in direction from current pixel position.
-        x, y = self.pos
-        nx = x + dir_[0]
-        ny = y + dir_[1]
-        next_cell = pixel_to_grid((nx, ny))
-        # Also check the cell ahead by a tile when aligned to center to prevent clipping
-        ahead_cell = add_tuple(self.current_cell(), dir_)
-        if is_centered(tuple(self.pos)) and self.maze.is_wall(ahead_cell):
-            return False
-        return not self.maze.is_wall(next_cell)
-
     def move(self):
-        if self.dir == STOP:
+        d = self.dir
+        if d == STOP:
             return
-        # Move pixel-wise but constrain by walls
-        for _ in range(int(self.speed)):
-            if self.can_move_dir(self.dir):
-                self.pos[0] += self.dir[0]
-                self.pos[1] += self.dir[1]
-            else:
-                break
-        # handle fractional speed
-        frac = self.speed - int(self.speed)
-        if frac > 0:
-            if self.can_move_dir(self.dir):
-                self.pos[0] += self.dir[0] * frac
-                self.pos[1] += self.dir[1] * frac
+        dx, dy = DVEC[d]
+        self.px, self.py = _move_step(self.px, self.py, dx, dy, self.speed, self.maze.grid)
 
     def draw(self, screen: pygame.Surface):
-        pygame.draw.circle(screen, self.color, (int(self.pos[0]), int(self.pos[1])), int(self.radius))
+        pygame.draw.circle(screen, self.color, (int(self.px), int(self.py)), int(self.radius))
 
 
 class Pacman(Actor):
@@ -229,9 +309,8 @@ class Pacman(Actor):
 
     def update(self):
         # Attempt to turn when centered
-        if self.pending_dir != STOP and is_centered(tuple(self.pos)):
-            ahead_cell = add_tuple(self.current_cell(), self.pending_dir)
-            if not self.maze.is_wall(ahead_cell):
+        if self.pending_dir != STOP and is_centered(self.px, self.py):
+            if self.pending_dir in self.maze.open_dirs[self.current_cell()]:
                 self.set_dir(self.pending_dir)
         self.move()
 
@@ -255,33 +334,27 @@ class Ghost(Actor):
         self.respawn_cell = cell
         self.alive = True
 
-    def available_dirs(self) -> List[Tuple[int, int]]:
-        # Consider 4 dirs but remove walls and prevent reversing unless needed
-        dirs = [UP, DOWN, LEFT, RIGHT]
-        valid = []
-        for d in dirs:
-            if self.maze.is_wall(add_tuple(self.current_cell(), d)):
-                continue
-            # Avoid reversing unless no choice
-            if d == opposite(self.dir) and not is_centered(tuple(self.pos)):
-                continue
-            valid.append(d)
-        if not valid:
-            valid = [opposite(self.dir)]
-        return valid
-
     def update(self):
-        # Change direction when centered at intersections
-        if is_centered(tuple(self.pos)):
-            options = self.available_dirs()
-            # Prefer not to reverse; if multiple options, pick random
-            if len(options) > 1 and opposite(self.dir) in options:
-                options.remove(opposite(self.dir))
-            self.set_dir(random.choice(options))
+        # Change direction when centered at intersections: the non-reversing
+        # options per (cell, direction) are precomputed, so picking one is a
+        # dict lookup plus an index.
+        px, py = self.px, self.py
+        if is_centered(px, py):
+            opts = self.maze.open_dirs_norev[(pixel_to_grid(px, py), self.dir)]
+            self.dir = opts[random.randrange(len(opts))]
         self.move()
 
+    def draw(self, screen: pygame.Surface):
+        if self.alive:
+            color = BLUE if self.frightened else GREY
+            pygame.draw.circle(screen, color, (int(self.px), int(self.py)), int(self.radius))
+        else:
+            # Draw small eyes marker at spawn
+            sx, sy = grid_to_pixel(self.respawn_cell)
+            pygame.draw.circle(screen, WHITE, (int(sx), int(sy)), int(TILE_SIZE * 0.15))
+
     def reset_to_spawn(self):
-        self.pos = list(grid_to_pixel(self.respawn_cell))
+        self.px, self.py = grid_to_pixel(self.respawn_cell)
         self.set_dir(random.choice([UP, DOWN, LEFT, RIGHT]))
         self.alive = True
         self.frightened = False
@@ -306,22 +379,58 @@ class Game:
             Ghost(self.maze, (3, 1), PINK),
             Ghost(self.maze, (3, 5), CYAN),
         ]
+        # Ghost state mirrored structure-of-arrays style so the collision
+        # check is one vectorized distance computation for all ghosts.
+        self.ghost_pos = np.empty((len(self.ghosts), 2), dtype=np.float32)
+        self.ghost_alive = np.ones(len(self.ghosts), dtype=bool)
+        self._sync_ghosts()
+        # Flat draw list (pacman last so he renders on top); each entry's
+        # draw() handles its own state, keeping the render loop uniform.
+        self._drawables = [*self.ghosts, self.pacman]
+
+        # Reused/cached surfaces: allocating (and format-converting) these
+        # every frame is wasteful, so build once and re-render on change only.
+        self._overlay = pygame.Surface((WIDTH, HEIGHT - UI_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self._overlay.fill((0, 0, 0, 150))
+        self._score_cache: Tuple[int, pygame.Surface] = (-1, None)
+        self._lives_cache: Tuple[int, pygame.Surface] = (-1, None)
+        self._power_cache: Tuple[int, pygame.Surface] = (-1, None)
+        self._end_cache: Tuple[str, pygame.Surface] = ("", None)
+        self._restart_text = self.font.render("Press R to Restart or ESC to Quit", True, WHITE)
 
         self.score = 0
         self.lives = 3
         self.power_expires_at = 0  # ms timestamp
+        # Frame timestamp, refreshed once per loop iteration so the rest of
+        # the frame avoids repeated get_ticks() calls.
+        self._now = pygame.time.get_ticks()
         self.running = True
         self.win = False
         self.game_over = False
 
+        # Dirty-rect presentation state: last drawn rect per actor, the UI
+        # snapshot that decides when the score bar must be re-presented, and
+        # flags for the occasional full-screen pass (first frame, end screen).
+        self._last_rects: List[pygame.Rect] = []
+        self._ui_state = None
+        self._eaten_rect: Optional[pygame.Rect] = None
+        self._full_redraw = True
+        self._end_drawn = False
+
+    def _sync_ghosts(self):
+        for i, g in enumerate(self.ghosts):
+            self.ghost_pos[i, 0] = g.px
+            self.ghost_pos[i, 1] = g.py
+            self.ghost_alive[i] = g.alive
+
     def set_power_mode(self):
-        self.power_expires_at = pygame.time.get_ticks() + POWER_DURATION_MS
+        self.power_expires_at = self._now + POWER_DURATION_MS
         for g in self.ghosts:
             if g.alive:
                 g.frightened = True
 
     def update_power_mode(self):
-        if self.power_expires_at and pygame.time.get_ticks() > self.power_expires_at:
+        if self.power_expires_at and self._now > self.power_expires_at:
             self.power_expires_at = 0
             for g in self.ghosts:
                 g.frightened = False
@@ -330,36 +439,40 @@ class Game:
         cell = self.pacman.current_cell()
         gained = self.maze.eat_at(cell)
         if gained:
+            self._eaten_rect = pygame.Rect(cell[0] * TILE_SIZE, cell[1] * TILE_SIZE + UI_HEIGHT,
+                                           TILE_SIZE, TILE_SIZE)
             self.score += gained
             if gained == POWER_PELLET_SCORE:
                 self.set_power_mode()
 
     def collision_logic(self):
-        for g in self.ghosts:
-            if not g.alive:
-                continue
-            dist = math.hypot(self.pacman.pos[0] - g.pos[0], self.pacman.pos[1] - g.pos[1])
-            if dist < TILE_SIZE * 0.6:
-                if g.frightened:
-                    # Eat ghost
-                    g.alive = False
-                    self.score += GHOST_EAT_SCORE
-                    # Respawn ghost after delay
-                    pygame.time.set_timer(pygame.USEREVENT + 1, 1500, loops=1)
-                    g.frightened = False
-                else:
-                    # Pacman loses a life
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.game_over = True
-                    self.reset_round()
-                    return
+        d2 = ((self.ghost_pos[:, 0] - self.pacman.px) ** 2
+              + (self.ghost_pos[:, 1] - self.pacman.py) ** 2)
+        hits = np.where((d2 < COLLISION_DIST_SQ) & self.ghost_alive)[0]
+        for i in hits.tolist():
+            g = self.ghosts[i]
+            if g.frightened:
+                # Eat ghost
+                g.alive = False
+                self.ghost_alive[i] = False
+                self.score += GHOST_EAT_SCORE
+                # Respawn ghost after delay
+                pygame.time.set_timer(pygame.USEREVENT + 1, 1500, loops=1)
+                g.frightened = False
+            else:
+                # Pacman loses a life
+                self.lives -= 1
+                if self.lives <= 0:
+                    self.game_over = True
+                self.reset_round()
+                return
 
     def reset_round(self):
         # Reset positions without resetting score/pellets
         self.pacman = Pacman(self.maze, (3, 3))
         for g in self.ghosts:
             g.reset_to_spawn()
+        self._drawables = [*self.ghosts, self.pacman]
         self.power_expires_at = 0
 
     def check_win(self):
@@ -367,29 +480,72 @@ class Game:
             self.win = True
             self.game_over = True
 
+    @staticmethod
+    def _actor_rect(x: float, y: float, radius: float) -> pygame.Rect:
+        r = int(radius) + 2
+        return pygame.Rect(int(x) - r, int(y) - r, 2 * r, 2 * r)
+
+    def _ghost_rect(self, g: Ghost) -> pygame.Rect:
+        if g.alive:
+            return self._actor_rect(g.px, g.py, g.radius)
+        # Dead ghosts are drawn as an eyes marker at their spawn cell
+        sx, sy = grid_to_pixel(g.respawn_cell)
+        return self._actor_rect(sx, sy, TILE_SIZE * 0.15)
+
+    def _collect_dirty(self) -> List[pygame.Rect]:
+        # Regions changed this frame: where actors were, where they are now,
+        # the pulsing power pellets, any just-eaten pellet, and the UI bar
+        # when one of its values ticked over.
+        dirty = list(self._last_rects)
+        dirty.extend(self.maze.animated_rects())
+        if self._eaten_rect is not None:
+            dirty.append(self._eaten_rect)
+            self._eaten_rect = None
+        new_rects = [self._ghost_rect(g) for g in self.ghosts]
+        new_rects.append(self._actor_rect(self.pacman.px, self.pacman.py, self.pacman.radius))
+        dirty.extend(new_rects)
+        self._last_rects = new_rects
+
+        power_left = (max(0, (self.power_expires_at - self._now) // 1000)
+                      if self.power_expires_at else None)
+        ui_state = (self.score, self.lives, power_left)
+        if ui_state != self._ui_state:
+            self._ui_state = ui_state
+            dirty.append(pygame.Rect(0, 0, WIDTH, UI_HEIGHT))
+        return dirty
+
     def draw_ui(self):
         # UI bar
         pygame.draw.rect(self.screen, BLACK, (0, 0, WIDTH, UI_HEIGHT))
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-        lives_text = self.font.render(f"Lives: {self.lives}", True, WHITE)
+        if self.score != self._score_cache[0]:
+            self._score_cache = (self.score, self.font.render(f"Score: {self.score}", True, WHITE))
+        if self.lives != self._lives_cache[0]:
+            self._lives_cache = (self.lives, self.font.render(f"Lives: {self.lives}", True, WHITE))
+        score_text = self._score_cache[1]
+        lives_text = self._lives_cache[1]
         self.screen.blit(score_text, (16, 16))
         self.screen.blit(lives_text, (WIDTH - 16 - lives_text.get_width(), 16))
 
         if self.power_expires_at:
-            remaining = max(0, (self.power_expires_at - pygame.time.get_ticks()) // 1000)
-            ptext = self.font.render(f"Power: {remaining}s", True, ORANGE)
+            remaining = max(0, (self.power_expires_at - self._now) // 1000)
+            if remaining != self._power_cache[0]:
+                self._power_cache = (remaining, self.font.render(f"Power: {remaining}s", True, ORANGE))
+            ptext = self._power_cache[1]
             self.screen.blit(ptext, (WIDTH // 2 - ptext.get_width() // 2, 16))
 
     def draw_end_screen(self):
         msg = "YOU WIN!" if self.win else "GAME OVER"
-        color = GREEN if self.win else RED
-        surf = self.big_font.render(msg, True, color)
-        sub = self.font.render("Press R to Restart or ESC to Quit", True, WHITE)
+        if msg != self._end_cache[0]:
+            color = GREEN if self.win else RED
+            self._end_cache = (msg, self.big_font.render(msg, True, color))
+        surf = self._end_cache[1]
+        sub = self._restart_text
         self.screen.blit(surf, (WIDTH // 2 - surf.get_width() // 2, HEIGHT // 2 - 40))
         self.screen.blit(sub, (WIDTH // 2 - sub.get_width() // 2, HEIGHT // 2 + 10))
 
     def run(self):
         while self.running:
+            self._now = pygame.time.get_ticks()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self.running = False
@@ -414,36 +570,40 @@ class Game:
                 self.pacman.update()
                 for g in self.ghosts:
                     g.update()
+                self._sync_ghosts()
                 self.update_power_mode()
                 self.eat_logic()
                 self.collision_logic()
                 self.check_win()
 
-            # Drawing
-            self.maze.draw(self.screen)
-            if not self.game_over:
-                # Draw ghosts (blue when frightened, grey when dead)
-                for g in self.ghosts:
-                    if g.alive:
-                        color = GREY if not g.frightened else BLUE
-                        pygame.draw.circle(self.screen, color, (int(g.pos[0]), int(g.pos[1])), int(g.radius))
-                    else:
-                        # Draw small eyes marker at spawn
-                        sx, sy = grid_to_pixel(g.respawn_cell)
-                        pygame.draw.circle(self.screen, WHITE, (int(sx), int(sy)), int(TILE_SIZE * 0.15))
-                # Draw Pacman on top
-                self.pacman.draw(self.screen)
+            # Drawing: compose only the regions that changed this frame and
+            # present just those rects instead of flipping the whole window.
+            if self.game_over:
+                # The end screen is static; paint it once.
+                dirty = [] if self._end_drawn else [self.screen.get_rect()]
+                self._end_drawn = True
+            elif self._full_redraw:
+                self._collect_dirty()  # prime the per-actor rect tracking
+                dirty = [self.screen.get_rect()]
+                self._full_redraw = False
             else:
-                # Dim playfield
-                overlay = pygame.Surface((WIDTH, HEIGHT - UI_HEIGHT), pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, 150))
-                self.screen.blit(overlay, (0, UI_HEIGHT))
-                self.draw_end_screen()
+                dirty = self._collect_dirty()
+
+            if dirty:
+                self.maze.draw(self.screen, self._now, dirty)
+                if not self.game_over:
+                    # One uniform pass; each drawable renders its own state
+                    for d in self._drawables:
+                        d.draw(self.screen)
+                else:
+                    # Dim playfield
+                    self.screen.blit(self._overlay, (0, UI_HEIGHT))
+                    self.draw_end_screen()
 
-            # UI last
-            self.draw_ui()
+                # UI last
+                self.draw_ui()
 
-            pygame.display.flip()
+                pygame.display.update(dirty)
             self.clock.tick(FPS)
 
         pygame.quit()